@@ -17,6 +17,8 @@ class User(UserMixin, db.Model):
     
 class Favorite(db.Model):
     __tablename__ = 'favorites' # 建議明確定義表名，保持風格一致
+    # 收藏的查詢/刪除都以 (user_id, item_id) 定位；唯一約束同時提供複合索引，並保證同一項目只收藏一次
+    __table_args__ = (db.UniqueConstraint('user_id', 'item_id', name='uq_fav_user_item'),)
     
     id = db.Column(db.Integer, primary_key=True)
     
@@ -39,6 +41,11 @@ class Favorite(db.Model):
     
 class CartItem(db.Model):
     __tablename__ = 'cart_items'
+    # (user_id, item_id)：加入/刪除時定位單筆；(user_id, created_at)：籃子清單依加入時間排序
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'item_id', name='uq_cart_user_item'),
+        db.Index('ix_cart_user_created', 'user_id', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     item_id = db.Column(db.String(100), nullable=False)
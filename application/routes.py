@@ -1,6 +1,7 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, session
 from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy.exc import IntegrityError
 from . import db
 from .models import User, Favorite, Itinerary, ItineraryDetail
 from .nav_config import SIDEBAR_ITEMS
@@ -9,8 +10,8 @@ from .utils.attraction_mapping import ATTRACTION_TYPE_MAPPING
 from .utils.accommodation_mapping import ACCOMMODATION_TYPE_MAPPING
 from .utils.restaurant_mapping import RESTAURANT_TYPE_MAPPING
 import pandas as pd
+import numpy as np
 import json
-import os
 
 # ======================
 # Auth Blueprint
@@ -55,32 +56,9 @@ def logout():
     return redirect('/login')
 
 # ======================
-# 資料載入與清理工具
+# 共用資料 (沿用 application 套件載入的 DataFrame，不重複讀取 JSON)
 # ======================
-from .utils.data_clean import (
-    load_and_merge_attractions_data,
-    load_and_clean_event_data,
-    load_and_clean_hotel_data,
-    load_and_merge_restaurant_data
-)
-
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-
-def get_data_path(filename):
-    return os.path.join(DATA_DIR, filename)
-
-attraction_df = load_and_merge_attractions_data(
-    attraction_path=get_data_path('AttractionList.json'),
-    fee_path=get_data_path('AttractionFeeList.json'),
-    service_time_path=get_data_path('AttractionServiceTimeList.json')
-)
-event_df = load_and_clean_event_data(get_data_path('EventList.json'))
-hotel_df = load_and_clean_hotel_data(get_data_path('HotelList.json'))
-restaurant_df = load_and_merge_restaurant_data(
-    restaurant_path=get_data_path('RestaurantList.json'),
-    service_time_path=get_data_path('RestaurantServiceTimeList.json')
-)
+from . import attraction_df, event_df, hotel_df, restaurant_df
 
 # ======================
 # Member Blueprint
@@ -91,6 +69,11 @@ member_bp = Blueprint('member', __name__)
 def inject_common_vars():
     return dict(sidebar_items=SIDEBAR_ITEMS)
 
+def _has_img_flags(urls):
+    """縮圖網址有效 (非缺值、非空字串) 為 1，否則為 0；整欄一次以 np.where 計算"""
+    text = urls.astype(str)
+    return np.where(urls.notna() & (text != '') & (text != 'nan'), 1, 0)
+
 @member_bp.route('/recommend')
 @login_required
 def recommend():
@@ -106,7 +89,7 @@ def recommend():
 
     # --- 景點篩選 ---
     if 'attractions' in content_types:
-        filtered_df = attraction_df.copy()
+        filtered_df = attraction_df
         if "ThumbnailURL" in filtered_df.columns:
             filtered_df = filtered_df[filtered_df["ThumbnailURL"].notna() & (filtered_df["ThumbnailURL"] != "")]
         if attraction_types:
@@ -139,7 +122,7 @@ def recommend():
             if allowed_cats:
                 filtered_food = food_df[food_df["RestaurantCategory"].isin(allowed_cats)]
                 if not filtered_food.empty: food_df = filtered_food
-        food_df['has_img'] = food_df['ThumbnailURL'].apply(lambda x: 1 if x and str(x) != 'nan' and x != "" else 0)
+        food_df['has_img'] = _has_img_flags(food_df['ThumbnailURL'])
         recommended_restaurants = food_df.sort_values(by='has_img', ascending=False).head(9).to_dict('records')
 
     # --- 住宿篩選 ---
@@ -151,7 +134,7 @@ def recommend():
                 allowed_keywords += ACCOMMODATION_TYPE_MAPPING.get(t, [])
             mask = filtered_hotel_df["HotelName"].astype(str).apply(lambda name: any(kw in name for kw in allowed_keywords))
             filtered_hotel_df = filtered_hotel_df[mask]
-        filtered_hotel_df['has_img'] = filtered_hotel_df["ThumbnailURL"].apply(lambda x: 1 if x and str(x) != 'nan' and x != "" else 0)
+        filtered_hotel_df['has_img'] = _has_img_flags(filtered_hotel_df["ThumbnailURL"])
         recommended_hotels = filtered_hotel_df.sort_values(by='has_img', ascending=False).head(50).to_dict('records')
 
     return render_template('member/recommend.html', attractions=recommended_attractions, restaurants=recommended_restaurants, hotels=recommended_hotels)
@@ -183,14 +166,19 @@ def add_favorite():
     if not category or not item_id or not name:
         return jsonify({'status': 'error', 'message': '資料不完整'}) if is_ajax else redirect(request.referrer)
 
-    existed = Favorite.query.filter_by(user_id=current_user.id, item_id=item_id, category=category).first()
+    # favorites 對 (user_id, item_id) 有唯一約束：同一項目不論以哪個類別名稱 (餐飲 / 餐廳) 收藏都只存一筆
+    existed = db.session.query(Favorite.id).filter_by(user_id=current_user.id, item_id=item_id).first()
     if not existed:
         favorite = Favorite(
             user_id=current_user.id, item_id=item_id, category=category,
             name=name, image_url=request.form.get('image_url'), location=request.form.get('location')
         )
         db.session.add(favorite)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # 同一使用者同時送出兩次收藏時，後到的一筆撞到唯一約束，視為已收藏
+            db.session.rollback()
     
     return jsonify({'status': 'success'}) if is_ajax else redirect(url_for('member.favorites'))
 
@@ -221,9 +209,7 @@ def favorites():
 @member_bp.route('/favorites/remove/<int:fav_id>', methods=['POST'])
 @login_required
 def remove_favorite(fav_id):
-    fav = Favorite.query.filter_by(id=fav_id, user_id=current_user.id).first()
-    if fav:
-        db.session.delete(fav)
+    if Favorite.query.filter_by(id=fav_id, user_id=current_user.id).delete(synchronize_session=False):
         db.session.commit()
     return redirect(url_for('member.favorites'))
 
@@ -320,7 +306,7 @@ def save_all_schedule():
     data = request.get_json()
     try:
         for item in data.get('items', []):
-            detail = ItineraryDetail.query.get(int(item['id']))
+            detail = db.session.get(ItineraryDetail, int(item['id']))
             if detail and detail.itinerary.user_id == current_user.id:
                 detail.day_number = int(item['day_number'])
                 detail.sort_order = int(item['sort_order'])
@@ -351,7 +337,7 @@ def schedule_map(itinerary_id):
         id_col_map = {'景點': 'AttractionID', '餐飲': 'RestaurantID', '餐廳': 'RestaurantID', '住宿': 'HotelID', '活動': 'EventID'}
         df = df_map.get(category)
         if df is not None:
-            row = df[df[id_col_map[category]].astype(str) == str(item_id)]
+            row = df[df[id_col_map[category]] == str(item_id)]
             if not row.empty:
                 lat = row.iloc[0].get('Lat') or row.iloc[0].get('PositionLat')
                 lon = row.iloc[0].get('Lon') or row.iloc[0].get('PositionLon')
@@ -6,7 +6,8 @@ def build_attraction_image_index(attraction_df, save_path):
     vectors = []
     meta = []
 
-    for idx, row in attraction_df.iterrows():
+    # to_dict('records') 逐列取 dict，避免 iterrows 每列建立一個 Series
+    for idx, row in zip(attraction_df.index, attraction_df.to_dict('records')):
         img_url = (
             row.get("ThumbnailURL")
             or row.get("Picture.PictureUrl1")
@@ -3,6 +3,8 @@ from .data_clean import _ATTRACTION_CLASS_MAP
 
 ALERT_RANK_MAP = {'灰色': 2, '黃色': 3, '橙色': 4}
 ALL_COMPARE_METRICS = ['safety', 'cpi', 'pce', 'accommodation', 'transportation', 'travelers']
+# 地圖標記聚合設定 (Scattermapbox cluster)：縮放層級 14 以上才顯示個別標記
+MAP_CLUSTER = {'enabled': True, 'maxzoom': 14}
 TAB_STYLE = {
     'idle': {
         'borderRadius': '10px','padding': '0px','marginInline': '5px','display':'flex',
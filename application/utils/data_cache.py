@@ -0,0 +1,64 @@
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# 清理 / 前處理邏輯本身改版時也要讓快取失效 (data_transform 會匯入 const、data_validation)
+LOADER_SOURCES = [os.path.join(os.path.dirname(os.path.abspath(__file__)), f) for f in ('data_clean.py', 'data_transform.py', 'const.py', 'data_validation.py')]
+# 快取格式或讀回後的處理方式改變時手動遞增
+CACHE_VERSION = 2
+
+
+def source_fingerprint(paths, loader=None):
+    """
+    以來源檔的修改時間與大小產生版本雜湊，JSON 重新產生後快取自動失效。
+    loader 的 bytecode (組合了哪些前處理步驟)、CACHE_VERSION 與 pandas / pyarrow 版本一併納入，
+    在 __init__.py 調整 loader 組合或升級套件時也會重建快取。
+    """
+    h = hashlib.md5(f"v{CACHE_VERSION}:{pd.__version__}:{pa.__version__}".encode())
+    if loader is not None:
+        code = loader.__code__
+        h.update(code.co_code)
+        h.update(repr((code.co_consts, code.co_names)).encode())
+    for path in paths:
+        if os.path.exists(path):
+            st = os.stat(path)
+            h.update(f"{os.path.basename(path)}:{st.st_mtime_ns}:{st.st_size}".encode())
+    return h.hexdigest()[:12]
+
+
+def load_arrow_cached(name, loader, sources, cache_dir):
+    """
+    以 Arrow IPC (Feather) 檔快取清理後的 DataFrame，之後啟動不必再解析 JSON 與重跑前處理。
+    檔案不壓縮，memory-map 讀取時 Arrow table 直接對應檔案頁面；轉成 DataFrame 時仍會複製到各行程的記憶體，
+    多個 gunicorn worker 共用資料靠的是 preload_app (master 載入一次，fork 後 copy-on-write)。
+    """
+    fingerprint = source_fingerprint(list(sources) + LOADER_SOURCES, loader)
+    path = os.path.join(cache_dir, f"{name}-{fingerprint}.feather")
+
+    if not os.path.exists(path):
+        df = loader()
+        if df.empty:
+            return df
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            feather.write_feather(df, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, path)
+            # 清掉舊版本的快取檔
+            for old in os.listdir(cache_dir):
+                if old.startswith(f"{name}-") and old.endswith('.feather') and old != os.path.basename(path):
+                    os.remove(os.path.join(cache_dir, old))
+        except Exception as e:
+            print(f"Arrow 快取寫入失敗 ({name}): {e}")
+            return df
+
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    df = table.to_pandas()
+    # Arrow 的 list 欄位 (Images、ServiceList 等) 讀回時是 ndarray，轉回 list 與直接由 loader 產生的結果一致
+    for field in table.schema:
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+            df[field.name] = [v.tolist() if isinstance(v, np.ndarray) else v for v in df[field.name]]
+    return df
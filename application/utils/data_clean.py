@@ -89,6 +89,45 @@ def _load_and_normalize_json(file_path: str, list_key: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+ADDRESS_COLUMNS = ['PostalAddress.City', 'PostalAddress.Town', 'PostalAddress.StreetAddress']
+
+def _normalize_address_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    內部輔助函式：地址欄位統一轉為 string 型別並以空字串補缺值，
+    顯示時不必再做 str(...).replace('nan', '') 的處理。
+    """
+    cols = [c for c in ADDRESS_COLUMNS if c in df.columns]
+    if cols:
+        df[cols] = df[cols].astype('string').fillna('')
+    return df
+
+
+ID_COLUMNS = ['AttractionID', 'EventID', 'HotelID', 'RestaurantID']
+
+def _normalize_id_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    內部輔助函式：ID 欄位在載入時統一轉為字串 (缺值維持缺值)，
+    收藏、詳情、地圖點擊等以字串 ID 比對的地方不必再逐次 astype(str)。
+    """
+    for c in ID_COLUMNS:
+        if c in df.columns:
+            df[c] = df[c].astype(str).where(df[c].notna())
+    return df
+
+
+CATEGORY_COLUMNS = ['HotelClassName', 'PrimaryCategory', 'PostalAddress.City', 'PostalAddress.Town', 'CuisineNames', 'EventCategoryNames']
+
+def _optimize_dtypes(df: pd.DataFrame, cat_cols: List[str] = CATEGORY_COLUMNS) -> pd.DataFrame:
+    """
+    內部輔助函式：將低基數、常用於篩選/分組的欄位轉為 category，
+    減少記憶體並讓 isin / groupby / unique 改以整數代碼運算。
+    """
+    for c in cat_cols:
+        if c in df.columns:
+            df[c] = df[c].astype('category')
+    return df
+
+
 def _summarize_list_data(
     data_list: List[Dict[str, Any]], 
     name_key: str, 
@@ -362,6 +401,9 @@ def load_and_merge_attractions_data(
     
     # 過濾只保留需要的欄位
     attraction_df = df_combined.filter(items=FINAL_COLUMNS)
+    attraction_df = _normalize_address_columns(attraction_df)
+    attraction_df = _normalize_id_columns(attraction_df)
+    attraction_df = _optimize_dtypes(attraction_df)
     
     print(f"--- 景點資料處理完畢。總筆數: {len(attraction_df)} ---")
     return attraction_df
@@ -425,6 +467,9 @@ def load_and_clean_event_data(event_path: str) -> pd.DataFrame:
     ]
     
     final_event_df = event_df.reindex(columns=keep_cols)
+    final_event_df = _normalize_address_columns(final_event_df)
+    final_event_df = _normalize_id_columns(final_event_df)
+    final_event_df = _optimize_dtypes(final_event_df)
     
     print(f"--- 活動資料處理完畢。總筆數: {len(final_event_df)} ---")
     
@@ -517,6 +562,9 @@ def load_and_clean_hotel_data(hotel_path: str) -> pd.DataFrame:
     # 清理不必要的空格
     if 'HotelName' in final_hotel_df.columns:
         final_hotel_df['HotelName'] = final_hotel_df['HotelName'].str.strip()
+    final_hotel_df = _normalize_address_columns(final_hotel_df)
+    final_hotel_df = _normalize_id_columns(final_hotel_df)
+    final_hotel_df = _optimize_dtypes(final_hotel_df)
 
     print(f"--- 旅館資料處理完畢。總筆數: {len(final_hotel_df)} ---")
     return final_hotel_df.copy()
@@ -705,6 +753,9 @@ def load_and_merge_restaurant_data(
     # 清理不必要的空格
     if 'RestaurantName' in restaurant_df.columns:
         restaurant_df['RestaurantName'] = restaurant_df['RestaurantName'].str.strip()
+    restaurant_df = _normalize_address_columns(restaurant_df)
+    restaurant_df = _normalize_id_columns(restaurant_df)
+    restaurant_df = _optimize_dtypes(restaurant_df)
         
     print(f"--- 餐廳資料處理完畢。總筆數: {len(restaurant_df)} ---")
     return restaurant_df
\ No newline at end of file
@@ -90,6 +90,39 @@ def preprocess_hotel_df(df):
 def preprocess_restaurant_df(df):
     return df.copy()
 
+IMAGE_COLUMNS = ['ThumbnailURL', 'Picture.PictureUrl1', 'PictureUrl1']
+
+def add_card_columns(df: pd.DataFrame, name_col: str, id_col: str) -> pd.DataFrame:
+    """
+    在載入時為各類資料加上統一欄位 _Name / _ID / _Image / _City / _FullAddress，
+    卡片與收藏只需各取一次欄位，不必逐列以 row.get(...) or row.get(...) 串接多個候選欄位。
+    _Image / _City 以空字串表示缺值；_ID 缺值維持缺值 (卡片改用列編號)。
+    """
+    def _blank_to_na(s):
+        return s.astype(object).where(s.notna() & (s.astype(str) != ''))
+
+    name = _blank_to_na(df[name_col]) if name_col in df.columns else pd.Series(np.nan, index=df.index, dtype=object)
+    image = pd.Series(np.nan, index=df.index, dtype=object)
+    for c in IMAGE_COLUMNS:
+        if c in df.columns:
+            image = image.combine_first(_blank_to_na(df[c]))
+    city = df['PostalAddress.City'] if 'PostalAddress.City' in df.columns else pd.Series('', index=df.index)
+
+    # 完整地址：縣市 + 鄉鎮 + 街道一次向量化串接，全空時依序退回 Address / Location 欄位
+    parts = [df[c].astype(str) for c in ['PostalAddress.City', 'PostalAddress.Town', 'PostalAddress.StreetAddress'] if c in df.columns]
+    address = _blank_to_na(parts[0].str.cat(parts[1:]) if parts else pd.Series('', index=df.index))
+    for c in ['Address', 'Location']:
+        if c in df.columns:
+            address = address.combine_first(_blank_to_na(df[c]))
+
+    return df.assign(
+        _Name=name.fillna('未命名').astype(str),
+        _ID=df[id_col] if id_col in df.columns else np.nan,
+        _Image=image.fillna('').astype(str),
+        _City=city.astype(str),
+        _FullAddress=address.fillna('暫無地址資訊').astype(str),
+    )
+
 # def filter_by_cost_and_types(df, cost_min, cost_max, acc_types):
 #     """依住宿費區間 + 住宿類型多選過濾"""
 #     if cost_min is not None:
@@ -197,6 +230,109 @@ def get_exploded_categories(df: pd.DataFrame, column_name: str, separator: str =
     
     return sorted(s.unique().tolist())
 
+def build_category_texts(series: pd.Series) -> list:
+    """
+    多值類別欄位 (category dtype) 各類別值的字串版本，順序與 series.cat.categories 一致；
+    最後一格是 NaN 轉字串後的 'nan' (cat.codes 為 -1 的列)，與原本 astype(str) 的比對結果一致。
+    """
+    return [str(c) for c in series.cat.categories] + ['nan']
+
+def category_contains_mask(series: pd.Series, category_texts: list, wanted) -> np.ndarray:
+    """
+    回傳「該列文字包含 wanted 其中任一值」的布林遮罩，結果與 astype(str).str.contains 相同
+    (例如選「節慶活動」也會包含「節慶活動 - 燈會」這類子分類)。
+    只對各類別做一次子字串比對，再依 cat.codes 展開到每一列。
+    """
+    wanted = [str(w) for w in wanted]
+    hit = np.array([any(w in text for w in wanted) for text in category_texts])
+    return hit[series.cat.codes.to_numpy()]
+
+def attraction_filter_mask(df: pd.DataFrame, city=None, town=None, cats=()) -> np.ndarray:
+    """景點篩選條件的布林遮罩 (numpy 陣列，與 df 的列一一對應)"""
+    mask = np.ones(len(df), dtype=bool)
+    if city: mask &= (df['PostalAddress.City'] == city).to_numpy()
+    if town: mask &= (df['PostalAddress.Town'] == town).to_numpy()
+    if cats: mask &= df['PrimaryCategory'].isin(cats).to_numpy()
+    return mask
+
+def event_filter_mask(df: pd.DataFrame, category_texts: list, city=None, cats=(), start_date=None, end_date=None) -> np.ndarray:
+    """活動篩選條件的布林遮罩；category_texts 為 build_category_texts(df['EventCategoryNames'])"""
+    mask = np.ones(len(df), dtype=bool)
+    if city:
+        mask &= (df['PostalAddress.City'] == city).to_numpy()
+    if cats:
+        # EventCategoryNames 可能包含多個類別，任一類別被選取即符合
+        mask &= category_contains_mask(df['EventCategoryNames'], category_texts, cats)
+    if start_date and end_date:
+        # 活動結束時間 >= 查詢開始時間 且 活動開始時間 <= 查詢結束時間
+        mask &= ((df['EndDateTime'] >= start_date) & (df['StartDateTime'] <= end_date)).to_numpy()
+    return mask
+
+def hotel_filter_mask(df: pd.DataFrame, city=None, min_price=None, max_price=None, stars_types=()) -> np.ndarray:
+    """旅館篩選條件的布林遮罩；stars_types 混合星級 (數字) 與旅館類型 (文字)，任一符合即可"""
+    mask = np.ones(len(df), dtype=bool)
+    if city:
+        mask &= (df['PostalAddress.City'] == city).to_numpy()
+
+    # 價格篩選 (資料沒有 LowestPrice 欄位時忽略)
+    if (min_price is not None or max_price is not None) and 'LowestPrice' in df.columns:
+        if min_price: mask &= (df['LowestPrice'] >= min_price).to_numpy()
+        if max_price: mask &= (df['LowestPrice'] <= max_price).to_numpy()
+
+    # 星級與類型篩選 (混合在同一個 dropdown)
+    if stars_types:
+        selected_stars = [x for x in stars_types if isinstance(x, int) or (isinstance(x, str) and x.isdigit())]
+        selected_types = [x for x in stars_types if isinstance(x, str) and not x.isdigit()]
+        star_mask = np.zeros(len(df), dtype=bool)
+        if selected_stars:
+            star_mask |= df['HotelStars'].isin([int(s) for s in selected_stars]).to_numpy()
+        if selected_types:
+            star_mask |= df['HotelClassName'].isin(selected_types).to_numpy()
+        mask &= star_mask
+    return mask
+
+def restaurant_filter_rows(df: pd.DataFrame, city_index: dict, category_texts: list, city=None, cuisines=()) -> np.ndarray:
+    """
+    符合餐廳篩選條件的列位置 (依原順序)。
+    縣市先以預建索引 (groupby.indices) 取得列位置，菜系條件只在這些列上判斷。
+    """
+    if city:
+        rows = city_index.get(city, np.empty(0, dtype=np.intp))
+    else:
+        rows = np.arange(len(df))
+    if cuisines:
+        # CuisineNames 可能包含多個分類，任一分類被選取即符合
+        rows = rows[category_contains_mask(df['CuisineNames'].take(rows), category_texts, cuisines)]
+    return rows
+
+def paginate(n_rows: int, page_input, keep_page: bool, per_page: int):
+    """
+    回傳 (總頁數, 校正範圍後的目前頁碼)。沒有資料時仍視為 1 頁；
+    keep_page 為 False (篩選條件變動) 時回到第 1 頁，否則把輸入的頁碼夾在 1 ~ 總頁數之間。
+    """
+    pages = max(1, -(-n_rows // per_page))
+    return pages, (max(1, min(pages, page_input or 1)) if keep_page else 1)
+
+_NAME_SEP = '\x00'
+
+def build_name_lookup(names) -> tuple:
+    """
+    關鍵字搜尋用的名稱索引：小寫名稱以 NUL 字元串成單一字串並記錄每列起點，
+    查詢時只需一次 str.find + 二分搜尋定位列。回傳 (text, starts)。
+    """
+    lowered = ['' if pd.isna(n) else str(n).lower().replace(_NAME_SEP, '') for n in names]
+    starts = np.cumsum([0] + [len(n) + 1 for n in lowered[:-1]])
+    return _NAME_SEP.join(lowered), starts
+
+def first_name_match(lookup, keyword: str) -> int:
+    """回傳第一個名稱包含 keyword (不分大小寫、不當作 regex) 的列位置，找不到時回傳 -1"""
+    if not keyword or _NAME_SEP in keyword:
+        # 含分隔字元的關鍵字會跨到相鄰名稱，不可能是單一名稱的子字串
+        return -1
+    text, starts = lookup
+    hit = text.find(keyword.lower())
+    return -1 if hit < 0 else int(np.searchsorted(starts, hit, side='right') - 1)
+
 def adjust_costs_with_cpi(out_df):
     """用 CPI 做相對調整，讓不同國家成本可比"""
     out = out_df.copy()
@@ -0,0 +1,31 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _to_unit_xyz(lats, lons):
+    """經緯度轉為單位球面上的 3D 座標"""
+    lat_r = np.radians(np.asarray(lats, dtype=np.float64))
+    lon_r = np.radians(np.asarray(lons, dtype=np.float64))
+    cos_lat = np.cos(lat_r)
+    return np.column_stack([cos_lat * np.cos(lon_r), cos_lat * np.sin(lon_r), np.sin(lat_r)])
+
+
+def build_point_tree(lats, lons):
+    """
+    在載入時建立 KD-tree，讓半徑查詢從 O(N) 全掃描變成 O(log N)。
+    座標先轉為單位球面 3D 座標，弦長與球面距離一一對應，半徑查詢結果與 haversine 一致。
+    回傳 (tree, rows)：rows 為有效 (非 NaN) 座標在原陣列中的位置。
+    """
+    lats, lons = np.asarray(lats), np.asarray(lons)
+    rows = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+    return cKDTree(_to_unit_xyz(lats[rows], lons[rows])), rows
+
+
+def query_radius(point_tree, lat0, lon0, radius_km):
+    """回傳距離中心點 radius_km 公里內的列位置 (依原順序排序)"""
+    tree, rows = point_tree
+    chord = 2 * np.sin(radius_km / (2 * EARTH_RADIUS_KM))
+    hits = tree.query_ball_point(_to_unit_xyz([lat0], [lon0])[0], r=chord)
+    return np.sort(rows[np.asarray(hits, dtype=np.intp)])
@@ -1,3 +1,6 @@
+import os
+import threading
+from functools import lru_cache
 import numpy as np
 import torch
 import torch.nn as nn
@@ -6,7 +9,21 @@ from torchvision import models, transforms
 # 💡 必須與生成索引時的模型一致
 model = models.resnet50(weights=models.ResNet50_Weights.IMAGENET1K_V1)
 model = nn.Sequential(*list(model.children())[:-1])
-model.eval()
+# 權重在匯入時載入 CPU 一次 (gunicorn preload 時由 master 載入，fork 後各 worker 共用)
+model = model.eval()
+
+# CUDA 在 fork 前初始化的話子行程無法使用，因此裝置在各行程第一次搜尋時才決定並搬移模型
+_device_state = {'pid': None, 'device': None}
+_device_lock = threading.Lock()
+
+def _model_device():
+    """回傳本行程推論用的裝置 (有 GPU 時用 GPU)；每個行程只在第一次呼叫時搬移模型"""
+    with _device_lock:
+        if _device_state['pid'] != os.getpid():
+            device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+            model.to(device)
+            _device_state.update(pid=os.getpid(), device=device)
+        return _device_state['device']
 
 preprocess = transforms.Compose([
     transforms.Resize(256),
@@ -15,26 +32,38 @@ preprocess = transforms.Compose([
     transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
 ])
 
-def search_similar_images(input_img, index_path, top_k=15):
-    # 1. 載入索引檔
+@lru_cache(maxsize=4)
+def load_image_index(index_path):
+    """
+    讀取特徵索引 ({景點 ID: 特徵向量}) 並整理成 (ID 陣列, 單位化後的特徵矩陣)。
+    同一路徑只讀一次，之後每次搜尋直接共用記憶體中的矩陣。
+    """
     feature_db = np.load(index_path, allow_pickle=True).item()
+    ids = np.array(list(feature_db.keys()), dtype=object)
+    feats = np.vstack(list(feature_db.values())).astype(np.float32)
+    # 💡 方案一優化：資料庫特徵也要單位化 (載入時做一次)
+    norms = np.linalg.norm(feats, axis=1, keepdims=True)
+    feats /= np.where(norms == 0, 1, norms)
+    return ids, feats
+
+def search_similar_images(input_img, index_path, top_k=15):
+    # 1. 載入索引檔 (已快取)
+    ids, feats = load_image_index(index_path)
     
     # 2. 提取上傳圖片的特徵
     img_t = preprocess(input_img)
-    batch_t = torch.unsqueeze(img_t, 0)
-    with torch.no_grad():
-        input_feature = model(batch_t).flatten().numpy()
+    batch_t = torch.unsqueeze(img_t, 0).to(_model_device())
+    with torch.inference_mode():
+        input_feature = model(batch_t).flatten().cpu().numpy()
         # 💡 方案一優化：單位化向量
         input_feature = input_feature / np.linalg.norm(input_feature)
 
-    # 3. 計算相似度
-    results = []
-    for idx, db_feature in feature_db.items():
-        # 💡 方案一優化：資料庫特徵也要單位化
-        db_feature = db_feature / np.linalg.norm(db_feature)
-        similarity = np.dot(input_feature, db_feature)
-        results.append({"index": idx, "score": similarity})
-
-    # 4. 排序
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:top_k]
\ No newline at end of file
+    # 3. 計算相似度：一次矩陣乘法算出與所有景點的 cosine similarity
+    scores = feats @ input_feature
+
+    # 4. 只排序前 top_k 名
+    k = min(top_k, len(scores))
+    if k == 0: return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind='stable')]
+    return [{"index": ids[i], "score": scores[i]} for i in top]
@@ -6,6 +6,7 @@ import dash_bootstrap_components as dbc
 import plotly.express as px
 import plotly.colors as colors
 from .data_validation import fmt
+from .const import MAP_CLUSTER
 import plotly.express as px
 from typing import Literal
 
@@ -37,12 +38,12 @@ def build_compare_figure(df_result, chart_type, title):
             else:
                 df_normalized[col] = 50
 
-        for _, row in df_normalized.iterrows():
-            values = [row[col] if pd.notna(row[col]) else 0 for col in metric_columns]
-            if values:
-                values.append(values[0])
-            theta = metric_columns + [metric_columns[0]] if metric_columns else metric_columns
-            fig.add_trace(go.Scatterpolar(r=values, theta=theta, fill='toself', name=row['Country']))
+        # 一次取出整個指標矩陣 (缺值補 0)，逐列只需切片，不必用 iterrows 每列建立 Series
+        theta = metric_columns + [metric_columns[0]]
+        matrix = df_normalized[metric_columns].astype(float).fillna(0).to_numpy()
+        for country, values in zip(df_normalized['Country'].tolist(), matrix.tolist()):
+            values.append(values[0])
+            fig.add_trace(go.Scatterpolar(r=values, theta=theta, fill='toself', name=country))
 
         fig.update_layout(
             polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
@@ -333,9 +334,10 @@ def generate_map(df: pd.DataFrame, city: str, color_by_column: str):
         fig.update_layout(template='plotly_dark')
         return fig
 
-    # 確保經緯度是數值型，以便計算中心點 (如果數據處理階段沒做)
-    df_plot['Lat'] = pd.to_numeric(df_plot['Lat'], errors='coerce')
-    df_plot['Lon'] = pd.to_numeric(df_plot['Lon'], errors='coerce')
+    # 確保經緯度是數值型，以便計算中心點 (如果數據處理階段沒做)；
+    # 以 float32 輸出 (精度約 1 公尺)，序列化後的圖表 JSON 明顯縮短
+    df_plot['Lat'] = pd.to_numeric(df_plot['Lat'], errors='coerce').astype('float32')
+    df_plot['Lon'] = pd.to_numeric(df_plot['Lon'], errors='coerce').astype('float32')
 
     # 確保顏色欄位存在 (如果不存在，則預設使用類別)
     if color_by_column not in df_plot.columns:
@@ -390,6 +392,9 @@ def generate_map(df: pd.DataFrame, city: str, color_by_column: str):
         }
     )
 
+    # 標記聚合：大量景點在低縮放層級時合併為群集，放大後才展開為個別標記
+    fig_map.update_traces(cluster=MAP_CLUSTER)
+
     return fig_map
 
 PRICE_COLUMN = 'LowestPrice' 
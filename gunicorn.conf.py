@@ -0,0 +1,25 @@
+# gunicorn.conf.py
+# 正式環境啟動：gunicorn app:app (會自動讀取本設定檔)
+import os
+
+# 對外服務時不能沿用程式內的預設 SECRET_KEY (公開在原始碼中，任何人都能偽造 session)，未設定就直接拒絕啟動
+if not os.environ.get('SECRET_KEY'):
+    raise RuntimeError("以 gunicorn 啟動時必須設定環境變數 SECRET_KEY")
+
+# preload：資料載入、索引與 layout 在 master 行程建立一次，fork 後各 worker 以 copy-on-write 共用
+preload_app = True
+workers = 4
+worker_class = 'gthread'
+threads = 4
+bind = '0.0.0.0:8000'
+
+
+def post_fork(server, worker):
+    # master 行程若已建立過資料庫連線 (例如 SLOWDAYS_INIT_DB=1 建表)，連線不能跨行程共用；
+    # fork 後丟棄繼承來的連線池 (不關閉 socket，交給 master)，各 worker 自行重新連線並預熱
+    from app import app
+    from application import warm_db_pool
+    from application.extensions import db
+    with app.app_context():
+        db.engine.dispose(close=False)
+    warm_db_pool(app)
@@ -0,0 +1,13 @@
+import os
+import sys
+import types
+
+# 單元測試只測 application.utils 內的純函式：
+# 先以 application 目錄登記一個空的套件，避免匯入子模組時執行 application/__init__.py
+# (那會載入全部資料、建立 Dash app 並載入 ResNet 模型)
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'application')
+
+if 'application' not in sys.modules:
+    package = types.ModuleType('application')
+    package.__path__ = [APP_DIR]
+    sys.modules['application'] = package
@@ -0,0 +1,40 @@
+import re
+
+import pandas as pd
+
+from application.utils.data_transform import build_category_texts, category_contains_mask
+
+
+def _baseline_mask(series, wanted):
+    """原本的篩選方式：整欄轉字串後以 regex 做子字串比對"""
+    pattern = '|'.join(re.escape(str(w)) for w in wanted)
+    return series.astype(str).str.contains(pattern).to_numpy()
+
+
+EVENT_CATEGORIES = pd.Series([
+    '節慶活動', '節慶活動 - 燈會', '藝文活動,節慶活動 - 市集', '藝文活動', '其他', None, '藝文活動,其他', '節慶活動 - 燈會',
+], dtype='category')
+
+
+def test_keeps_hierarchical_subcategories():
+    mask = category_contains_mask(EVENT_CATEGORIES, build_category_texts(EVENT_CATEGORIES), ('節慶活動',))
+    assert mask.tolist() == [True, True, True, False, False, False, False, True]
+
+
+def test_matches_str_contains_for_each_option():
+    texts = build_category_texts(EVENT_CATEGORIES)
+    for wanted in [('節慶活動',), ('藝文活動',), ('其他',), ('燈會', '其他'), ('不存在',)]:
+        assert category_contains_mask(EVENT_CATEGORIES, texts, wanted).tolist() == _baseline_mask(EVENT_CATEGORIES, wanted).tolist()
+
+
+def test_subset_rows_share_category_texts():
+    # 餐廳篩選先以縣市索引 take 出部分列，類別字串仍用整欄建立的那一份
+    texts = build_category_texts(EVENT_CATEGORIES)
+    rows = [1, 3, 6]
+    subset = EVENT_CATEGORIES.take(rows)
+    assert category_contains_mask(subset, texts, ('其他',)).tolist() == _baseline_mask(subset, ('其他',)).tolist()
+
+
+def test_nan_rows_follow_astype_str():
+    s = pd.Series(['甲', None], dtype='category')
+    assert category_contains_mask(s, build_category_texts(s), ('nan',)).tolist() == [False, True]
@@ -0,0 +1,72 @@
+import os
+
+import pandas as pd
+
+from application.utils.data_cache import load_arrow_cached, source_fingerprint
+
+
+def _sample_df():
+    return pd.DataFrame({
+        'ID': ['A1', 'A2', 'A3'],
+        'PostalAddress.City': pd.Categorical(['臺北市', '臺南市', '臺北市']),
+        'Images': [[{'URL': 'a.jpg', 'Name': '甲'}], [], None],
+        'ServiceList': [['停車場', 'WiFi'], ['WiFi'], None],
+        'Lat': [25.03, 22.99, None],
+    })
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_round_trip_matches_loader_output(tmp_path):
+    source = tmp_path / 'List.json'
+    _write(source, '[]')
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return _sample_df()
+
+    fresh = load_arrow_cached('sample', loader, [str(source)], str(tmp_path / 'cache'))
+    cached = load_arrow_cached('sample', loader, [str(source)], str(tmp_path / 'cache'))
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(cached, fresh)
+    # list 欄位讀回後仍是 Python list (不是 ndarray)
+    assert cached['Images'].iloc[0] == [{'URL': 'a.jpg', 'Name': '甲'}]
+    assert isinstance(cached['ServiceList'].iloc[0], list)
+    assert cached['ServiceList'].iloc[1] == ['WiFi']
+    assert cached['PostalAddress.City'].dtype == 'category'
+
+
+def test_changed_source_invalidates_fingerprint(tmp_path):
+    source = tmp_path / 'List.json'
+    _write(source, '[]')
+    before = source_fingerprint([str(source)])
+    assert source_fingerprint([str(source)]) == before
+
+    _write(source, '[{"ID": 1}]')
+    assert source_fingerprint([str(source)]) != before
+
+
+def test_changed_loader_invalidates_fingerprint(tmp_path):
+    source = tmp_path / 'List.json'
+    _write(source, '[]')
+    assert source_fingerprint([str(source)], lambda: _sample_df()) != source_fingerprint([str(source)], lambda: _sample_df().head(1))
+
+
+def test_changed_source_rebuilds_and_drops_stale_file(tmp_path):
+    source = tmp_path / 'List.json'
+    cache_dir = tmp_path / 'cache'
+    _write(source, '[]')
+    load_arrow_cached('sample', _sample_df, [str(source)], str(cache_dir))
+    first = os.listdir(cache_dir)
+
+    _write(source, '[{"ID": 1}]')
+    df = load_arrow_cached('sample', lambda: _sample_df().head(2), [str(source)], str(cache_dir))
+    second = os.listdir(cache_dir)
+
+    assert len(df) == 2
+    assert len(first) == len(second) == 1 and first != second
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from application.utils.data_transform import build_name_lookup, first_name_match
+from application.utils.geo import EARTH_RADIUS_KM, build_point_tree, query_radius
+
+NAMES = pd.Series(['Taipei 101', '國立故宮博物院', None, '臺北市立動物園', '101 Mall (B1)', '', '故宮晶華'])
+
+
+def _baseline_first_match(names, keyword):
+    """原本的作法：整欄 str.contains (不分大小寫) 後取第一筆"""
+    hits = np.flatnonzero(names.str.contains(keyword, case=False, regex=False, na=False).to_numpy())
+    return int(hits[0]) if len(hits) else -1
+
+
+def _haversine_km(lat0, lon0, lats, lons):
+    lat0, lon0, lats, lons = map(np.radians, (lat0, lon0, np.asarray(lats), np.asarray(lons)))
+    a = np.sin((lats - lat0) / 2) ** 2 + np.cos(lat0) * np.cos(lats) * np.sin((lons - lon0) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def test_first_name_match_matches_str_contains():
+    lookup = build_name_lookup(NAMES)
+    for keyword in ['taipei', 'TAIPEI', '101', '故宮', '動物園', '(B1)', 'Mall', '晶華', '不存在', '1\n國', '1\x00國']:
+        assert first_name_match(lookup, keyword) == _baseline_first_match(NAMES, keyword)
+
+
+def test_first_name_match_empty_names():
+    assert first_name_match(build_name_lookup(pd.Series([], dtype=object)), '故宮') == -1
+
+
+def test_query_radius_matches_haversine():
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(21.9, 25.3, 2000)
+    lons = rng.uniform(120.0, 122.0, 2000)
+    lats[::97] = np.nan  # 沒有座標的列不會被查到
+    tree = build_point_tree(lats, lons)
+    for lat0, lon0, radius in [(25.03, 121.56, 3), (22.99, 120.20, 10), (23.97, 121.60, 50)]:
+        dist = _haversine_km(lat0, lon0, lats, lons)
+        expected = np.flatnonzero(dist <= radius)
+        assert query_radius(tree, lat0, lon0, radius).tolist() == expected.tolist()
@@ -0,0 +1,37 @@
+from application.utils.data_transform import paginate
+
+PER_PAGE = 15
+
+
+def test_empty_result_is_one_page():
+    assert paginate(0, None, False, PER_PAGE) == (1, 1)
+    assert paginate(0, 3, True, PER_PAGE) == (1, 1)
+
+
+def test_page_count_rounds_up():
+    assert paginate(1, None, False, PER_PAGE) == (1, 1)
+    assert paginate(15, None, False, PER_PAGE) == (1, 1)
+    assert paginate(16, None, False, PER_PAGE) == (2, 1)
+    assert paginate(31, None, False, PER_PAGE) == (3, 1)
+
+
+def test_last_page_is_kept():
+    pages, curr = paginate(31, 3, True, PER_PAGE)
+    assert (pages, curr) == (3, 3)
+    # 最後一頁只剩下餘數的那幾筆
+    assert len(range(31)[(curr - 1) * PER_PAGE: curr * PER_PAGE]) == 1
+
+
+def test_page_past_the_end_is_clamped():
+    assert paginate(31, 4, True, PER_PAGE) == (3, 3)
+    assert paginate(31, 99, True, PER_PAGE) == (3, 3)
+
+
+def test_missing_or_invalid_page_falls_back_to_first():
+    assert paginate(31, None, True, PER_PAGE) == (3, 1)
+    assert paginate(31, 0, True, PER_PAGE) == (3, 1)
+    assert paginate(31, -2, True, PER_PAGE) == (3, 1)
+
+
+def test_filter_change_resets_to_first_page():
+    assert paginate(31, 2, False, PER_PAGE) == (3, 1)
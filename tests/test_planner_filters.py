@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+from application.utils.data_transform import (
+    attraction_filter_mask,
+    build_category_texts,
+    event_filter_mask,
+    hotel_filter_mask,
+    restaurant_filter_rows,
+)
+
+# 以下 _baseline_* 為改寫前 callback 內以 DataFrame 逐步篩選的寫法，作為比對基準
+
+CITIES = pd.Categorical(['臺北市', '臺南市', '臺北市', '花蓮縣', None, '臺南市'])
+TOWNS = pd.Categorical(['中正區', '中西區', '大安區', '花蓮市', None, '安平區'])
+
+ATTRACTIONS = pd.DataFrame({
+    'PostalAddress.City': CITIES,
+    'PostalAddress.Town': TOWNS,
+    'PrimaryCategory': pd.Categorical(['古蹟', '夜市', '自然風景', '自然風景', '古蹟', None]),
+})
+
+EVENTS = pd.DataFrame({
+    'PostalAddress.City': CITIES,
+    'EventCategoryNames': pd.Categorical(['節慶活動', '節慶活動 - 燈會', '藝文活動', '藝文活動,節慶活動 - 市集', None, '其他']),
+    'StartDateTime': pd.to_datetime(['2025-01-01', '2025-02-10', '2025-03-01', '2025-01-20', '2025-05-01', '2024-12-01']),
+    'EndDateTime': pd.to_datetime(['2025-01-05', '2025-02-20', '2025-03-31', '2025-02-15', '2025-05-02', '2025-12-31']),
+})
+
+HOTELS = pd.DataFrame({
+    'PostalAddress.City': CITIES,
+    'LowestPrice': [1200.0, 3500.0, np.nan, 800.0, 5000.0, 2600.0],
+    'HotelStars': [5.0, 3.0, np.nan, 1.0, 5.0, 4.0],
+    'HotelClassName': pd.Categorical(['國際觀光旅館', '一般旅館', '民宿', '民宿', '國際觀光旅館', '一般旅館']),
+})
+
+RESTAURANTS = pd.DataFrame({
+    'PostalAddress.City': CITIES,
+    'CuisineNames': pd.Categorical(['中式料理', '日式料理,其他', '其他', '中式料理 - 台菜', None, '西式料理']),
+})
+
+
+def _baseline_attractions(df, city, town, cats):
+    if city: df = df[df['PostalAddress.City'] == city]
+    if town: df = df[df['PostalAddress.Town'] == town]
+    if cats: df = df[df['PrimaryCategory'].isin(cats)]
+    return df.index.to_numpy()
+
+
+def _baseline_events(df, city, cats, start_date, end_date):
+    if city: df = df[df['PostalAddress.City'] == city]
+    if cats: df = df[df['EventCategoryNames'].apply(lambda x: any(cat in str(x) for cat in cats))]
+    if start_date and end_date:
+        df = df[(df['EndDateTime'] >= start_date) & (df['StartDateTime'] <= end_date)]
+    return df.index.to_numpy()
+
+
+def _baseline_hotels(df, city, min_price, max_price, stars_types):
+    if city: df = df[df['PostalAddress.City'] == city]
+    if min_price is not None or max_price is not None:
+        if min_price: df = df[df['LowestPrice'] >= min_price]
+        if max_price: df = df[df['LowestPrice'] <= max_price]
+    if stars_types:
+        selected_stars = [x for x in stars_types if isinstance(x, int) or (isinstance(x, str) and x.isdigit())]
+        selected_types = [x for x in stars_types if isinstance(x, str) and not x.isdigit()]
+        mask = pd.Series(False, index=df.index)
+        if selected_stars: mask |= df['HotelStars'].isin([int(s) for s in selected_stars])
+        if selected_types: mask |= df['HotelClassName'].isin(selected_types)
+        df = df[mask]
+    return df.index.to_numpy()
+
+
+def _baseline_restaurants(df, city, cuisines):
+    if city: df = df[df['PostalAddress.City'] == city]
+    if cuisines: df = df[df['CuisineNames'].apply(lambda x: any(c in str(x) for c in cuisines))]
+    return df.index.to_numpy()
+
+
+def test_attraction_filter_matches_baseline():
+    for city, town, cats in [
+        (None, None, ()), ('臺北市', None, ()), ('臺北市', '大安區', ()), (None, None, ('古蹟',)),
+        ('臺南市', None, ('夜市', '古蹟')), ('不存在', None, ()),
+    ]:
+        rows = np.flatnonzero(attraction_filter_mask(ATTRACTIONS, city, town, cats))
+        assert rows.tolist() == _baseline_attractions(ATTRACTIONS, city, town, cats).tolist()
+
+
+def test_event_filter_matches_baseline():
+    texts = build_category_texts(EVENTS['EventCategoryNames'])
+    for city, cats, start_date, end_date in [
+        (None, (), None, None), (None, ('節慶活動',), None, None), ('臺南市', ('節慶活動', '其他'), None, None),
+        (None, (), '2025-02-01', '2025-02-28'), (None, ('藝文活動',), '2025-03-15', '2025-03-16'), ('臺北市', (), '2025-01-10', None),
+    ]:
+        rows = np.flatnonzero(event_filter_mask(EVENTS, texts, city, cats, start_date, end_date))
+        assert rows.tolist() == _baseline_events(EVENTS, city, cats, start_date, end_date).tolist()
+
+
+def test_hotel_filter_matches_baseline():
+    for city, min_price, max_price, stars_types in [
+        (None, None, None, ()), ('臺北市', None, None, ()), (None, 1000, None, ()), (None, None, 3000, ()),
+        (None, 1000, 4000, ()), (None, None, None, (5,)), (None, None, None, ('3', '民宿')), ('臺南市', 0, 3000, (4, '一般旅館')),
+    ]:
+        rows = np.flatnonzero(hotel_filter_mask(HOTELS, city, min_price, max_price, stars_types))
+        assert rows.tolist() == _baseline_hotels(HOTELS, city, min_price, max_price, stars_types).tolist()
+
+
+def test_restaurant_filter_matches_baseline():
+    city_index = RESTAURANTS.groupby('PostalAddress.City', observed=True).indices
+    texts = build_category_texts(RESTAURANTS['CuisineNames'])
+    for city, cuisines in [
+        (None, ()), ('臺北市', ()), (None, ('中式料理',)), (None, ('其他', '西式料理')), ('臺南市', ('其他',)), ('不存在', ()),
+    ]:
+        rows = restaurant_filter_rows(RESTAURANTS, city_index, texts, city, cuisines)
+        assert rows.tolist() == _baseline_restaurants(RESTAURANTS, city, cuisines).tolist()